@@ -8,14 +8,17 @@ We'll build this up incrementally, keeping it simple and understandable.
 import streamlit as st
 import pandas as pd
 import os
+import atexit
 from datetime import datetime
 from pyathena import connect
-from pyathena.pandas.cursor import PandasCursor
+from pyathena.arrow.cursor import ArrowCursor
 from dotenv import load_dotenv
 import boto3
+from botocore.config import Config
+from boto3.dynamodb.conditions import Attr
 from botocore.exceptions import ClientError
-import plotly.graph_objects as go
 import numpy as np
+import pyarrow as pa
 
 # Load environment variables from .env file (if it exists)
 # This makes it easy to set config without hardcoding values
@@ -44,28 +47,27 @@ st.markdown("---")
 
 # Configuration - supports both Streamlit Secrets (for cloud) and .env files (for local)
 # Priority: st.secrets > environment variables > .env file > defaults
-def get_config(key, default=None):
-    """Get configuration value from Streamlit secrets, env vars, or default"""
-    # First try Streamlit secrets (for Streamlit Cloud)
+@st.cache_resource
+def load_secrets():
+    """Read Streamlit secrets once per server process into a plain dict"""
+    # Every get_config call used to re-probe st.secrets on each rerun; the secrets
+    # file doesn't change while the server is running, so snapshot it once
     try:
-        # Method 1: Try accessing through 'default' section (most common in Streamlit Cloud)
-        # Secrets are typically structured as: [default] ATHENA_S3_OUTPUT = "value"
+        # Top-level keys first, then the [default] section (most common in Streamlit
+        # Cloud: [default] ATHENA_S3_OUTPUT = "value") so it takes precedence
+        secrets = {key: value for key, value in st.secrets.items() if key != "default"}
         if "default" in st.secrets:
-            if key in st.secrets["default"]:
-                return st.secrets["default"][key]
-            # Try as attribute access
-            if hasattr(st.secrets["default"], key):
-                return getattr(st.secrets["default"], key)
-        
-        # Method 2: Try accessing directly at top level
-        # Some users might put secrets at top level without [default] section
-        if key in st.secrets:
-            return st.secrets[key]
-        if hasattr(st.secrets, key):
-            return getattr(st.secrets, key)
-            
-    except (AttributeError, KeyError, TypeError):
-        pass
+            secrets.update(st.secrets["default"])
+        return secrets
+    except (AttributeError, KeyError, TypeError, FileNotFoundError):
+        # No secrets file configured (local development with .env)
+        return {}
+
+def get_config(key, default=None):
+    """Get configuration value from Streamlit secrets, env vars, or default"""
+    secrets = load_secrets()
+    if key in secrets:
+        return secrets[key]
     
     # Fall back to environment variables or .env file
     return os.getenv(key, default)
@@ -115,10 +117,54 @@ if not ATHENA_S3_OUTPUT:
     """)
     st.stop()
 
+# SHARED AWS CONNECTIONS
+# st.cache_resource keeps a single instance per server process, so every rerun and
+# every browser session reuses the same HTTPS connection pool instead of paying for
+# a new client, credential lookup, and TLS handshake each time
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=int(get_config("BOTO_MAX_POOL_CONNECTIONS", "50")),
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    # Fail fast on an unreachable endpoint instead of botocore's 60s defaults
+    connect_timeout=5,
+    read_timeout=30
+)
+
+@st.cache_resource
+def get_dynamodb_resource(region):
+    """Get a shared boto3 DynamoDB resource (one per server process)"""
+    # Built from its own session, once, inside the cached call; the session isn't
+    # shared with anything else or used again after this returns
+    return boto3.session.Session().resource('dynamodb', region_name=region, config=AWS_CLIENT_CONFIG)
+
+@st.cache_resource
+def get_athena_connection():
+    """Get a shared Athena connection (one per server process)"""
+    conn = connect(
+        s3_staging_dir=ATHENA_S3_OUTPUT,
+        region_name=ATHENA_REGION,
+        schema_name=ATHENA_SCHEMA,
+        cursor_class=ArrowCursor,
+        config=AWS_CLIENT_CONFIG,
+        # Let Athena return a matching SELECT's stored result from the last hour
+        # instead of rescanning S3 (the marts only change when dbt runs). This only
+        # helps load_sgp_percentiles: the rankings load runs as UNLOAD, which isn't
+        # eligible and gets a new output path in its query text on every run
+        result_reuse_enable=True,
+        result_reuse_minutes=60
+    )
+    # Close the shared connection when the server process shuts down
+    atexit.register(conn.close)
+    return conn
+
 # SIMPLE DYNAMODB FUNCTIONS FOR DRAFT TRACKING
+# Cached per (table_name, region) so the DescribeTable call in load() runs once per
+# server process instead of on every rerun. No st.success() in here: elements called
+# inside a cached function are replayed on every cache hit.
+@st.cache_resource(show_spinner="Preparing draft table...")
 def get_dynamodb_table(table_name, region):
     """Get or create DynamoDB table for draft tracking"""
-    dynamodb = boto3.resource('dynamodb', region_name=region)
+    dynamodb = get_dynamodb_resource(region)
     table = dynamodb.Table(table_name)
     
     try:
@@ -131,118 +177,191 @@ def get_dynamodb_table(table_name, region):
                 AttributeDefinitions=[{'AttributeName': 'player_id', 'AttributeType': 'S'}],
                 BillingMode='PAY_PER_REQUEST'
             )
-            table.wait_until_exists()
-            st.success(f"Created DynamoDB table: {table_name}")
+            # Poll every 2s rather than wait_until_exists()'s 20s default, so a new
+            # draft session is usable a few seconds after creation
+            dynamodb.meta.client.get_waiter('table_exists').wait(
+                TableName=table_name,
+                WaiterConfig={'Delay': 2, 'MaxAttempts': 30}
+            )
+            # Show the new session in the session list right away
+            fetch_draft_session_ids.clear()
     
     return table
 
 def mark_player_drafted(table, player_id, player_name=None):
     """Mark a player as drafted in DynamoDB"""
     try:
-        # Get existing item if it exists to preserve "drafted_to_my_team" status
-        existing_item = {}
-        try:
-            response = table.get_item(Key={'player_id': str(player_id)})
-            if 'Item' in response:
-                existing_item = response['Item']
-        except:
-            pass
-        
-        table.put_item(
-            Item={
-                'player_id': str(player_id),
-                'drafted': True,
-                'drafted_at': datetime.now().isoformat(),
-                'player_name': player_name or str(player_id),
-                'drafted_to_my_team': existing_item.get('drafted_to_my_team', False)  # Preserve my team status
+        drafted_at = datetime.now().isoformat()
+        # One UpdateItem instead of get_item + put_item: if_not_exists keeps an
+        # existing "drafted_to_my_team" status without reading the item first,
+        # and the update is atomic if another device edits the same player
+        table.update_item(
+            Key={'player_id': str(player_id)},
+            UpdateExpression=(
+                'SET #drafted = :drafted, #drafted_at = :drafted_at, #player_name = :player_name, '
+                '#my_team = if_not_exists(#my_team, :not_my_team)'
+            ),
+            ExpressionAttributeNames={
+                '#drafted': 'drafted',
+                '#drafted_at': 'drafted_at',
+                '#player_name': 'player_name',
+                '#my_team': 'drafted_to_my_team'
+            },
+            ExpressionAttributeValues={
+                ':drafted': True,
+                ':drafted_at': drafted_at,
+                ':player_name': player_name or str(player_id),
+                ':not_my_team': False
             }
         )
+        # my team status is left as is, just like the if_not_exists above
+        update_local_draft_state(table, player_id, drafted=True)
         return True
     except Exception as e:
         st.error(f"Error marking player as drafted: {str(e)}")
         return False
 
-def mark_player_undrafted(table, player_id):
-    """Mark a player as undrafted (remove from DynamoDB)"""
+def mark_players_undrafted(table, player_ids):
+    """Mark many players as undrafted at once (batched deletes)"""
     try:
-        table.delete_item(Key={'player_id': str(player_id)})
+        # batch_writer sends up to 25 deletes per BatchWriteItem request and
+        # retries any unprocessed items, instead of one DeleteItem call per player
+        with table.batch_writer() as batch:
+            for player_id in player_ids:
+                batch.delete_item(Key={'player_id': str(player_id)})
+        for player_id in player_ids:
+            update_local_draft_state(table, player_id, drafted=False, my_team=False)
         return True
     except Exception as e:
-        st.error(f"Error marking player as undrafted: {str(e)}")
+        st.error(f"Error marking players as undrafted: {str(e)}")
         return False
 
-def mark_player_to_my_team(table, player_id, player_name=None, is_my_team=True):
-    """Mark a player as drafted to my team (also marks as drafted)"""
+def write_draft_changes(table, changes):
+    """Write several players' final draft states at once (batched puts/deletes)"""
+    # changes holds (player_id, player_name, drafted, my_team) tuples;
+    # players that are no longer drafted are deleted
     try:
-        table.put_item(
-            Item={
-                'player_id': str(player_id),
-                'drafted': True,  # Always mark as drafted if on my team
-                'drafted_to_my_team': is_my_team,
-                'drafted_at': datetime.now().isoformat(),
-                'player_name': player_name or str(player_id)
-            }
-        )
+        # One timestamp for the whole batch rather than a datetime.now() per item
+        drafted_at = datetime.now().isoformat()
+        # batch_writer sends up to 25 writes per BatchWriteItem request;
+        # overwrite_by_pkeys keeps only the last write if a player appears twice
+        with table.batch_writer(overwrite_by_pkeys=['player_id']) as batch:
+            for player_id, player_name, drafted, my_team in changes:
+                if drafted:
+                    batch.put_item(
+                        Item={
+                            'player_id': str(player_id),
+                            'drafted': True,
+                            'drafted_to_my_team': my_team,
+                            'drafted_at': drafted_at,
+                            'player_name': player_name or str(player_id)
+                        }
+                    )
+                else:
+                    batch.delete_item(Key={'player_id': str(player_id)})
+        for player_id, _, drafted, my_team in changes:
+            update_local_draft_state(table, player_id, drafted=drafted, my_team=my_team)
         return True
     except Exception as e:
-        st.error(f"Error marking player to my team: {str(e)}")
+        st.error(f"Error saving draft changes: {str(e)}")
         return False
 
-def get_drafted_players(table, draft_session_id, force_refresh=False):
-    """Get set of all drafted player IDs (cached in session state)"""
-    cache_key = f"drafted_players_{draft_session_id}"
+def scan_all_items(table, **scan_kwargs):
+    """Yield every item from a table scan, following LastEvaluatedKey across pages"""
+    # The resource's own client keeps the high-level behaviour (Attr conditions,
+    # plain Python values in Items), and its paginator handles ExclusiveStartKey
+    paginator = table.meta.client.get_paginator('scan')
+    for page in paginator.paginate(TableName=table.name, **scan_kwargs):
+        yield from page.get('Items', [])
+
+@st.cache_data(ttl=10, show_spinner=False)
+def fetch_draft_state(draft_session_id, _table):
+    """Scan the draft table for drafted / my team player IDs (cached for 10 seconds)"""
+    # st.cache_data is shared by every browser session, so several devices following
+    # the same draft (and repeated reads within one rerun) share a single scan.
+    # The leading underscore tells Streamlit not to hash the table object.
+    # Only fetch the attributes we read (skips player_name / drafted_at on the wire),
+    # and let DynamoDB drop any undrafted items server-side (my team players are
+    # always drafted, so both sets come from the drafted items)
+    scan_kwargs = {
+        # Strongly consistent, so a write acknowledged before the scan starts is in it
+        'ConsistentRead': True,
+        'FilterExpression': Attr('drafted').eq(True),
+        'ProjectionExpression': '#pid, #drafted, #my_team',
+        'ExpressionAttributeNames': {
+            '#pid': 'player_id',
+            '#drafted': 'drafted',
+            '#my_team': 'drafted_to_my_team'
+        }
+    }
     
-    # Return cached result if available and not forcing refresh
-    if not force_refresh and cache_key in st.session_state:
-        return st.session_state[cache_key]
+    # Taken before the scan starts: any write that finished before this moment is
+    # included in the scan (get_draft_state compares it to this session's last write)
+    scanned_at = datetime.now()
     
-    try:
-        response = table.scan()
-        drafted_ids = set()
-        for item in response.get('Items', []):
-            if item.get('drafted', False):
-                drafted_ids.add(item['player_id'])
-        
-        while 'LastEvaluatedKey' in response:
-            response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-            for item in response.get('Items', []):
-                if item.get('drafted', False):
-                    drafted_ids.add(item['player_id'])
-        
-        # Cache the result
-        st.session_state[cache_key] = drafted_ids
-        return drafted_ids
-    except Exception as e:
-        st.warning(f"Error getting drafted players: {str(e)}")
-        return set()
-
-def get_my_team_players(table, draft_session_id, force_refresh=False):
-    """Get set of all player IDs drafted to my team (cached in session state)"""
-    cache_key = f"my_team_players_{draft_session_id}"
+    # Build both sets in a single pass so each rerun pays for one scan, not two
+    drafted_ids = set()
+    my_team_ids = set()
+    for item in scan_all_items(_table, **scan_kwargs):
+        if item.get('drafted', False):
+            drafted_ids.add(item['player_id'])
+        if item.get('drafted_to_my_team', False):
+            my_team_ids.add(item['player_id'])
     
-    # Return cached result if available and not forcing refresh
-    if not force_refresh and cache_key in st.session_state:
-        return st.session_state[cache_key]
+    # The scan time tells get_draft_state whether this is a new scan or the cached one
+    return frozenset(drafted_ids), frozenset(my_team_ids), scanned_at
+
+def get_draft_state(table, draft_session_id, force_refresh=False):
+    """Get (drafted player IDs, my team player IDs) for a draft session (briefly cached)"""
+    if force_refresh:
+        clear_draft_state_cache(draft_session_id)
     
     try:
-        response = table.scan()
-        my_team_ids = set()
-        for item in response.get('Items', []):
-            if item.get('drafted_to_my_team', False):
-                my_team_ids.add(item['player_id'])
-        
-        while 'LastEvaluatedKey' in response:
-            response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-            for item in response.get('Items', []):
-                if item.get('drafted_to_my_team', False):
-                    my_team_ids.add(item['player_id'])
-        
-        # Cache the result
-        st.session_state[cache_key] = my_team_ids
-        return my_team_ids
+        drafted_ids, my_team_ids, scanned_at = fetch_draft_state(draft_session_id, table)
     except Exception as e:
-        st.warning(f"Error getting my team players: {str(e)}")
-        return set()
+        st.warning(f"Error getting draft status: {str(e)}")
+        return frozenset(), frozenset()
+    
+    # This browser session keeps its own copy of the draft state, which our writes
+    # update directly (see update_local_draft_state), so they show up without a rescan.
+    # It's replaced by a different scan (picking up other devices' picks) only if that
+    # scan started after our last write: the cache is shared, so another session's
+    # scan from just before our write would otherwise undo it until the TTL expires.
+    local_key = f"draft_state_{table.name}"
+    local_state = st.session_state.get(local_key)
+    if local_state is None:
+        local_state = (scanned_at, drafted_ids, my_team_ids, datetime.min)
+        st.session_state[local_key] = local_state
+    elif local_state[0] != scanned_at and scanned_at > local_state[3]:
+        local_state = (scanned_at, drafted_ids, my_team_ids, local_state[3])
+        st.session_state[local_key] = local_state
+    return local_state[1], local_state[2]
+
+def update_local_draft_state(table, player_id, drafted, my_team=None):
+    """Apply a successful write to this session's copy of the draft state (my_team=None leaves it unchanged)"""
+    local_key = f"draft_state_{table.name}"
+    if local_key not in st.session_state:
+        return
+    scanned_at, drafted_ids, my_team_ids, _ = st.session_state[local_key]
+    player_id = str(player_id)
+    drafted_ids = drafted_ids | {player_id} if drafted else drafted_ids - {player_id}
+    if my_team is not None:
+        my_team_ids = my_team_ids | {player_id} if my_team else my_team_ids - {player_id}
+    # Record when the write landed so get_draft_state ignores scans that predate it
+    st.session_state[local_key] = (scanned_at, drafted_ids, my_team_ids, datetime.now())
+
+def get_drafted_players(table, draft_session_id, force_refresh=False):
+    """Get set of all drafted player IDs (briefly cached)"""
+    return get_draft_state(table, draft_session_id, force_refresh)[0]
+
+def get_my_team_players(table, draft_session_id, force_refresh=False):
+    """Get set of all player IDs drafted to my team (briefly cached)"""
+    return get_draft_state(table, draft_session_id, force_refresh)[1]
+
+def clear_draft_state_cache(draft_session_id):
+    """Clear cached draft status so the next read goes back to DynamoDB"""
+    # clear() drops every session's entry; other sessions just rescan on their next read
+    fetch_draft_state.clear()
 
 def optimize_dataframe_memory(df):
     """Optimize DataFrame memory usage by converting to efficient dtypes"""
@@ -260,11 +379,15 @@ def optimize_dataframe_memory(df):
                     pass  # Skip if conversion fails
     
     # Downcast numeric columns to smaller types
-    for col in df.select_dtypes(include=['int64']).columns:
-        df[col] = pd.to_numeric(df[col], downcast='integer')
-    
-    for col in df.select_dtypes(include=['float64']).columns:
-        df[col] = pd.to_numeric(df[col], downcast='float')
+    # Check dtypes with the pandas type helpers rather than select_dtypes('int64'/'float64'),
+    # so nullable (Int64) and Arrow-backed numeric columns are downcast too
+    for col in df.columns:
+        if pd.api.types.is_bool_dtype(df[col]):
+            continue
+        if pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        elif pd.api.types.is_float_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='float')
     
     # Convert specific known columns to category for better memory usage
     category_columns = ['team', 'pos', 'projected_opening_day_status']
@@ -277,27 +400,55 @@ def optimize_dataframe_memory(df):
     
     return df
 
+def split_positions(pos):
+    """Split multi-position strings like "SS/OF" or "1B,3B" into one row per position"""
+    positions = pos.dropna().astype(str).str.split(r'[/,]', regex=True).explode().str.strip()
+    return positions[positions != '']
+
+def build_position_mask(pos):
+    """Encode each player's positions as a bitmask over the sorted position list"""
+    # Bit i is set when the player is eligible at the i-th position of
+    # sorted(unique positions) - the same order used for the position filter options
+    positions = split_positions(pos)
+    vocab = sorted(positions.unique().tolist())
+    pairs = pd.DataFrame({
+        'row': positions.index,
+        'bit': positions.map({p: i for i, p in enumerate(vocab)}).to_numpy(dtype=np.uint64)
+    }).drop_duplicates()  # a repeated position in one row must not be counted twice
+    # Each row's bits are distinct, so summing them is the same as OR-ing them together
+    pairs['value'] = np.left_shift(np.uint64(1), pairs['bit'].to_numpy())
+    bits = pairs.groupby('row')['value'].sum()
+    return bits.reindex(pos.index, fill_value=0).astype(np.uint64)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_draft_session_ids(region, table_name_prefix):
+    """List session IDs from the draft tables in DynamoDB (cached for 60 seconds)"""
+    # ListTables is a rate-limited control plane call, and the session list rarely
+    # changes, so it isn't re-run on every rerun
+    dynamodb = get_dynamodb_resource(region).meta.client
+    response = dynamodb.list_tables()
+    
+    # Filter tables that match our draft table prefix
+    all_tables = response.get('TableNames', [])
+    draft_tables = [t for t in all_tables if t.startswith(table_name_prefix + '_')]
+    
+    # Extract session IDs from table names (remove prefix and underscore)
+    session_ids = [t.replace(table_name_prefix + '_', '') for t in draft_tables]
+    
+    # Handle pagination
+    while 'LastEvaluatedTableName' in response:
+        response = dynamodb.list_tables(ExclusiveStartTableName=response['LastEvaluatedTableName'])
+        all_tables = response.get('TableNames', [])
+        draft_tables = [t for t in all_tables if t.startswith(table_name_prefix + '_')]
+        session_ids.extend([t.replace(table_name_prefix + '_', '') for t in draft_tables])
+    
+    return sorted(session_ids)
+
 def list_draft_sessions(region, table_name_prefix):
     """List all existing draft session tables"""
+    # Errors are handled out here so a failed listing isn't cached
     try:
-        dynamodb = boto3.client('dynamodb', region_name=region)
-        response = dynamodb.list_tables()
-        
-        # Filter tables that match our draft table prefix
-        all_tables = response.get('TableNames', [])
-        draft_tables = [t for t in all_tables if t.startswith(table_name_prefix + '_')]
-        
-        # Extract session IDs from table names (remove prefix and underscore)
-        session_ids = [t.replace(table_name_prefix + '_', '') for t in draft_tables]
-        
-        # Handle pagination
-        while 'LastEvaluatedTableName' in response:
-            response = dynamodb.list_tables(ExclusiveStartTableName=response['LastEvaluatedTableName'])
-            all_tables = response.get('TableNames', [])
-            draft_tables = [t for t in all_tables if t.startswith(table_name_prefix + '_')]
-            session_ids.extend([t.replace(table_name_prefix + '_', '') for t in draft_tables])
-        
-        return sorted(session_ids)
+        return fetch_draft_session_ids(region, table_name_prefix)
     except Exception as e:
         st.warning(f"Error listing draft sessions: {str(e)}")
         return []
@@ -307,23 +458,33 @@ existing_sessions = list_draft_sessions(DYNAMODB_REGION, DYNAMODB_TABLE_NAME)
 default_session = os.getenv("DRAFT_SESSION_ID", "default_draft")
 
 # Add option to create new session
-session_options = ["➕ Create New Session..."] + existing_sessions
+CREATE_NEW_SESSION = "➕ Create New Session..."
+session_options = [CREATE_NEW_SESSION] + existing_sessions
 
-# If default session exists, use it; otherwise use first option
-if default_session in existing_sessions:
-    default_index = existing_sessions.index(default_session) + 1  # +1 because of "Create New" option
+# Keep the session picked on an earlier run; otherwise use the default session if it
+# exists, or "Create New". (If the option list changes, Streamlit rebuilds the widget
+# at this index, so the selection has to be carried over by ID here.)
+previous_session = st.session_state.get("selected_draft_session")
+if previous_session in session_options:
+    default_index = session_options.index(previous_session)
+elif default_session in existing_sessions:
+    default_index = session_options.index(default_session)
 else:
     default_index = 0  # Default to "Create New"
 
-selected_session_option = st.selectbox(
+# Options are the session IDs themselves, not list positions: the session list is
+# re-fetched every minute, and a position could point at a different session once
+# another device adds one, sending writes to the wrong draft table
+selected_session = st.selectbox(
     "Draft Session",
     session_options,
     index=default_index,
     help="Select an existing draft session or create a new one"
 )
+st.session_state["selected_draft_session"] = selected_session
 
 # Handle session selection
-if selected_session_option == "➕ Create New Session...":
+if selected_session == CREATE_NEW_SESSION:
     # Show text input for new session name
     new_session_id = st.text_input(
         "New Draft Session ID",
@@ -338,7 +499,7 @@ if selected_session_option == "➕ Create New Session...":
         draft_session_id = default_session
 else:
     # Use the selected existing session
-    draft_session_id = selected_session_option
+    draft_session_id = selected_session
 
 # Draft type selection (Mock vs Live)
 draft_type_key = f"draft_type_{draft_session_id}"
@@ -356,41 +517,119 @@ draft_type = st.radio(
 # Note: st.radio with key automatically updates session_state
 # The widget will remember the user's selection on subsequent runs
 
-# Format selection
-format_type = st.selectbox("Select Format", ["50s", "OC"])
+# Rankings mart (dbt model) for each draft format
+RANKINGS_TABLES = {
+    "50s": "mart_preseason_overall_rankings_50s",
+    "OC": "mart_preseason_overall_rankings_oc",
+}
 
-# Clear cache from other format when switching (memory optimization)
-for other_format in ["50s", "OC"]:
-    if other_format != format_type:
-        other_cache_key = f"player_data_{other_format}"
-        if other_cache_key in st.session_state:
-            # Keep timestamp but clear data to free memory
-            del st.session_state[other_cache_key]
+# Format selection
+format_type = st.selectbox("Select Format", list(RANKINGS_TABLES))
 
 # Table name based on format
-table_name = f"mart_preseason_overall_rankings_{format_type.lower()}"
+table_name = RANKINGS_TABLES[format_type]
+
+# Columns the app actually uses from the rankings marts (memory optimization)
+# Selecting these instead of SELECT * means Athena scans and returns only the
+# Parquet columns we need
+RANKINGS_COLUMNS = (
+    'id', 'name', 'team', 'pos', 'rank', 'adp', 'min_pick', 'max_pick', 
+    'rank_diff', 'projected_opening_day_status', 'value', 
+    'pa', 'ab', 'r', 'hr', 'rbi', 'sb', 'avg', 'obp', 'slg', 
+    'ip', 'k', 'w', 'sv', 'era', 'whip'
+)
+
+# Map Arrow string columns to pyarrow-backed pandas strings when converting to pandas
+# (categorical columns like team/pos are dictionary-encoded and aren't affected)
+ARROW_STRING_DTYPES = {
+    pa.string(): pd.StringDtype("pyarrow"),
+    pa.large_string(): pd.StringDtype("pyarrow")
+}
 
 # CACHING EXPLANATION:
-# st.session_state is Streamlit's way to store data in memory between button clicks
-# We'll use it to store the player data so we don't query Athena every time
-# Key: format_type (so 50s and OC have separate cached data)
-cache_key = f"player_data_{format_type}"
-timestamp_key = f"cache_timestamp_{format_type}"
+# st.cache_data stores the result of a function keyed on its arguments, so each
+# format gets its own cached copy and unrelated actions (marking a pick, changing
+# a filter) never trigger another Athena query. Entries expire after 15 minutes.
+@st.cache_data(ttl=900, max_entries=2, show_spinner="Loading data from Athena...")
+def load_player_rankings(table_name):
+    """Load player rankings from a mart table (cached per table for 15 minutes)"""
+    # Connect to Athena (shared connection)
+    conn = get_athena_connection()
+    
+    # Only the columns in RANKINGS_COLUMNS are scanned and returned.
+    # Filters are applied in pandas: the full player pool also feeds the draft
+    # summary, team stats, and mock draft, and pushing widget filters into SQL
+    # would mean a new Athena query on every filter change.
+    columns_str = ', '.join(RANKINGS_COLUMNS)
+    # No ORDER BY: the rows are sorted by rank in pandas below, so a distributed sort
+    # in Athena would be wasted work. The table name is resolved against the
+    # connection's schema_name (ATHENA_SCHEMA), so it isn't schema-qualified here.
+    query = f"SELECT {columns_str} FROM {table_name}"
+    
+    # Execute query and get results as pandas DataFrame
+    # unload=True has Athena write the result as Parquet (UNLOAD), which ArrowCursor
+    # reads directly with pyarrow instead of parsing the default CSV result.
+    # UNLOAD never hits Athena's result reuse; repeat loads are covered by this
+    # function's own st.cache_data instead
+    cursor = conn.cursor(unload=True)
+    df = cursor.execute(query).as_arrow().to_pandas()
+    
+    # Sort by rank once here (UNLOAD wouldn't keep a SQL ORDER BY across output files);
+    # the rest of the app relies on rows being in rank order
+    df = df.sort_values('rank', ignore_index=True)
+    
+    # Normalize id to strings once here, to match the player IDs stored in DynamoDB,
+    # so draft status lookups never need to convert the column on each rerun
+    df['id'] = df['id'].astype(str)
+    
+    # Optimize memory usage before caching
+    df = optimize_dataframe_memory(df)
+    
+    # Lowercase names once here so the name search is a plain substring match
+    if 'name' in df.columns:
+        df['name_lower'] = df['name'].str.lower()
+    
+    # Precompute a position bitmask so the position filter is a single integer AND
+    if 'pos' in df.columns:
+        df['pos_mask'] = build_position_mask(df['pos'])
+    
+    # Cache an Arrow table rather than the DataFrame: st.cache_data pickles its
+    # return value, and Arrow tables serialize as columnar buffers instead of one
+    # Python object per string (dtypes, including categories, round-trip intact)
+    # Return the load time with the data so we can show when it was cached
+    return pa.Table.from_pandas(df, preserve_index=False), datetime.now()
 
-# Check if we already have data cached for this format
-if cache_key not in st.session_state:
-    # No cached data - we'll need to load it
-    st.session_state[cache_key] = None
-    st.session_state[timestamp_key] = None
+@st.cache_data(ttl=900, max_entries=4, show_spinner=False)
+def load_sgp_percentiles(format_type):
+    """Load SGP percentiles for a format's most recent year (cached per format for 15 minutes)"""
+    # Connect to Athena (shared connection)
+    conn = get_athena_connection()
+    
+    # mart_sgp_percentiles_latest (dbt) already holds only each format's most recent
+    # year, so there's no filename parsing or max-year lookup at query time
+    # The table isn't schema-qualified: the connection's schema_name (ATHENA_SCHEMA)
+    # resolves it
+    percentiles_query = """
+    SELECT 
+        category,
+        p80,
+        p90
+    FROM mart_sgp_percentiles_latest
+    WHERE format_part = %(format_type)s
+    """
+    
+    # format_type is passed as a query parameter (PyAthena quotes and escapes it)
+    # rather than pasted into the SQL string
+    cursor = conn.cursor()
+    return cursor.execute(percentiles_query, {'format_type': format_type}).as_arrow().to_pandas()
 
-# Button to refresh/load data
 # Refresh button to clear cache and reload data
 refresh_button = st.button("🔄 Refresh Data", help="Clear cached data and reload from Athena")
 
 # If refresh button clicked, clear the cache and recalculate pick counter
 if refresh_button:
-    st.session_state[cache_key] = None
-    st.session_state[timestamp_key] = None
+    load_player_rankings.clear()
+    load_sgp_percentiles.clear()
     # Recalculate pick counter from DynamoDB to sync with other devices
     try:
         draft_table_name = f"{DYNAMODB_TABLE_NAME}_{draft_session_id}"
@@ -402,52 +641,92 @@ if refresh_button:
         pass  # Silently fail if DynamoDB isn't available
     st.info("Cache cleared! Data will reload automatically.")
 
-# Load data automatically if we don't have cached data yet
-if st.session_state[cache_key] is None:
-    with st.spinner("Loading data from Athena..."):
-        try:
-            # Connect to Athena
-            conn = connect(
-                s3_staging_dir=ATHENA_S3_OUTPUT,
-                region_name=ATHENA_REGION,
-                schema_name=ATHENA_SCHEMA,
-                cursor_class=PandasCursor
-            )
-            
-            # Select only columns we actually use (memory optimization)
-            # This reduces memory usage significantly compared to SELECT *
-            columns_needed = [
-                'id', 'name', 'team', 'pos', 'rank', 'adp', 'min_pick', 'max_pick', 
-                'rank_diff', 'projected_opening_day_status', 'value', 
-                'pa', 'ab', 'r', 'hr', 'rbi', 'sb', 'avg', 'obp', 'slg', 
-                'ip', 'k', 'w', 'sv', 'era', 'whip'
-            ]
-            columns_str = ', '.join(columns_needed)
-            query = f"SELECT {columns_str} FROM {ATHENA_SCHEMA}.{table_name} ORDER BY rank"
-            
-            # Execute query and get results as pandas DataFrame
-            cursor = conn.cursor()
-            df = cursor.execute(query).as_pandas()
-            
-            # Optimize memory usage before caching
-            df = optimize_dataframe_memory(df)
-            
-            # Store in session_state (this is the caching part!)
-            # Next time the page reruns, this data will still be here
-            st.session_state[cache_key] = df
-            st.session_state[timestamp_key] = datetime.now()
-            
-            st.success(f"Loaded {len(df)} players from Athena!")
-            
-        except Exception as e:
-            st.error(f"Error loading data: {str(e)}")
-            st.info("""
-            **Troubleshooting:**
-            1. Make sure AWS credentials are configured (run `aws configure`)
-            2. Check your .env file or environment variables
-            3. Make sure your dbt models are built (`dbt build --select mart_*`)
-            4. Check that the schema and table names match your setup
-            """)
+# Load data (served from the cache unless it expired or was cleared)
+player_data = None
+cached_time = None
+# (the cache shows its own spinner, only when it actually has to query Athena)
+try:
+    player_table, cached_time = load_player_rankings(table_name)
+    # Plain string columns (name, id) stay Arrow-backed, so string ops like the
+    # name search run as pyarrow compute kernels instead of per-row Python
+    player_data = player_table.to_pandas(types_mapper=ARROW_STRING_DTYPES.get)
+except Exception as e:
+    st.error(f"Error loading data: {str(e)}")
+    st.info("""
+    **Troubleshooting:**
+    1. Make sure AWS credentials are configured (run `aws configure`)
+    2. Check your .env file or environment variables
+    3. Make sure your dbt models are built (`dbt build --select mart_*`)
+    4. Check that the schema and table names match your setup
+    """)
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def get_filter_options(table_name, loaded_at, _df):
+    """Build the position, team, and status option lists for the filter widgets"""
+    # Keyed on the table and its load time (the dataframe itself isn't hashed), so
+    # the lists are built once per data load instead of on every rerun
+    positions_list = []
+    if 'pos' in _df.columns:
+        positions_list = sorted(split_positions(_df['pos']).unique().tolist())
+    
+    teams = []
+    if 'team' in _df.columns:
+        # team is categorical (see optimize_dataframe_memory), and its categories are
+        # already the sorted unique teams, so there's no need to scan the column
+        if isinstance(_df['team'].dtype, pd.CategoricalDtype):
+            teams = _df['team'].cat.categories.tolist()
+        else:
+            teams = sorted(_df['team'].dropna().unique().tolist())
+    
+    statuses = []
+    if 'projected_opening_day_status' in _df.columns:
+        # Also categorical, so its categories are the sorted unique statuses
+        if isinstance(_df['projected_opening_day_status'].dtype, pd.CategoricalDtype):
+            statuses = _df['projected_opening_day_status'].cat.categories.tolist()
+        else:
+            statuses = sorted(_df['projected_opening_day_status'].dropna().unique().tolist())
+    
+    return positions_list, teams, statuses
+
+def get_pick_rng():
+    """Get this browser session's random generator for simulated mock draft picks"""
+    # A Generator kept in session_state (instead of the legacy global np.random state):
+    # it's only created once per session and keeps advancing across picks
+    if 'mock_draft_rng' not in st.session_state:
+        st.session_state['mock_draft_rng'] = np.random.default_rng()
+    return st.session_state['mock_draft_rng']
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def format_display_df(table_name, loaded_at, player_ids, _df):
+    """Round the stat columns and format value for the results table"""
+    # Keyed on the data load and the ids on the page (the dataframe itself isn't
+    # hashed), since the stats only change when either does. Draft status columns
+    # are copied over fresh by the caller on every rerun.
+    
+    # Apply rounding to numeric columns: whole numbers, 3 decimal places (.000)
+    # and 2 decimal places (.00), all in a single round() call
+    whole_number_cols = ['pa', 'ab', 'r', 'hr', 'rbi', 'sb', 'ip', 'k', 'w', 'sv']
+    three_decimal_cols = ['avg', 'obp', 'slg']
+    two_decimal_cols = ['era', 'whip']
+    decimals = {
+        **{col: 0 for col in whole_number_cols},
+        **{col: 3 for col in three_decimal_cols},
+        **{col: 2 for col in two_decimal_cols}
+    }
+    # round() returns a new dataframe, so the caller's rows are never modified
+    df = _df.round({col: places for col, places in decimals.items() if col in _df.columns})
+    
+    # Arrow-backed ints allow missing values (like Int64) with a validity bitmap
+    int_cols = [col for col in whole_number_cols if col in df.columns]
+    df[int_cols] = df[int_cols].astype('int64[pyarrow]')
+    
+    # Format value as currency with cents
+    if 'value' in df.columns:
+        # map() with the bound str.format skips the per-row lambda; missing values become ""
+        value = pd.to_numeric(df['value'], errors='coerce').astype('float64')
+        df['value'] = value.map('${:,.2f}'.format, na_action='ignore').fillna('').astype('string[pyarrow]')
+    
+    return df
 
 # Helper function to render filters and return filtered dataframe
 def render_filters_and_apply(df, draft_table, draft_session_id):
@@ -466,92 +745,89 @@ def render_filters_and_apply(df, draft_table, draft_session_id):
         }
     
     # FILTERING SECTION
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        # Filter by position (multi-select)
-        if 'pos' in df.columns:
-            all_positions = set()
-            for pos_str in df['pos'].dropna():
-                if isinstance(pos_str, str):
-                    positions = pos_str.replace('/', ',').split(',')
-                    for p in positions:
-                        all_positions.add(p.strip())
-            positions_list = sorted(list(all_positions))
-            # Widget with key automatically manages its own session state
-            # Read from widget's session state, with fallback to our stored value
-            widget_key = f"filter_pos_{format_type}"
-            if widget_key not in st.session_state:
-                st.session_state[widget_key] = st.session_state[filter_key]['selected_positions']
-            
-            selected_positions = st.multiselect(
-                "Position (can select multiple)", 
-                positions_list,
-                default=st.session_state[widget_key],
-                help="Select one or more positions. Shows players who have ANY of these positions.",
-                key=widget_key
-            )
-            # Update our filter state from widget's session state
-            st.session_state[filter_key]['selected_positions'] = st.session_state[widget_key]
-        else:
-            selected_positions = []
-    
-    with col2:
-        # Filter by team (multi-select)
-        if 'team' in df.columns:
-            teams = sorted(df['team'].dropna().unique().tolist())
-            # Widget with key automatically manages its own session state
-            widget_key = f"filter_team_{format_type}"
-            if widget_key not in st.session_state:
-                st.session_state[widget_key] = st.session_state[filter_key]['selected_teams']
-            
-            selected_teams = st.multiselect(
-                "Team (can select multiple)", 
-                teams,
-                default=st.session_state[widget_key],
-                help="Select one or more teams. Shows players from ANY of these teams.",
-                key=widget_key
-            )
-            # Update our filter state from widget's session state
-            st.session_state[filter_key]['selected_teams'] = st.session_state[widget_key]
-        else:
-            selected_teams = []
-    
-    with col3:
-        # Filter by projected opening day status (multi-select)
-        if 'projected_opening_day_status' in df.columns:
-            statuses = sorted(df['projected_opening_day_status'].dropna().unique().tolist())
+    positions_list, teams, statuses = get_filter_options(table_name, cached_time, df)
+    # Group the filter widgets in a form so typing in the search box or picking
+    # several options only reruns the app once, when the filters are applied
+    with st.form(f"filters_form_{format_type}", border=False):
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            # Filter by position (multi-select)
+            if 'pos' in df.columns:
+                # Widget with key automatically manages its own session state
+                # Read from widget's session state, with fallback to our stored value
+                widget_key = f"filter_pos_{format_type}"
+                if widget_key not in st.session_state:
+                    st.session_state[widget_key] = st.session_state[filter_key]['selected_positions']
+        
+                selected_positions = st.multiselect(
+                    "Position (can select multiple)", 
+                    positions_list,
+                    default=st.session_state[widget_key],
+                    help="Select one or more positions. Shows players who have ANY of these positions.",
+                    key=widget_key
+                )
+                # Update our filter state from widget's session state
+                st.session_state[filter_key]['selected_positions'] = st.session_state[widget_key]
+            else:
+                selected_positions = []
+        
+        with col2:
+            # Filter by team (multi-select)
+            if 'team' in df.columns:
+                # Widget with key automatically manages its own session state
+                widget_key = f"filter_team_{format_type}"
+                if widget_key not in st.session_state:
+                    st.session_state[widget_key] = st.session_state[filter_key]['selected_teams']
+        
+                selected_teams = st.multiselect(
+                    "Team (can select multiple)", 
+                    teams,
+                    default=st.session_state[widget_key],
+                    help="Select one or more teams. Shows players from ANY of these teams.",
+                    key=widget_key
+                )
+                # Update our filter state from widget's session state
+                st.session_state[filter_key]['selected_teams'] = st.session_state[widget_key]
+            else:
+                selected_teams = []
+        
+        with col3:
+            # Filter by projected opening day status (multi-select)
+            if 'projected_opening_day_status' in df.columns:
+                # Widget with key automatically manages its own session state
+                widget_key = f"filter_status_{format_type}"
+                if widget_key not in st.session_state:
+                    st.session_state[widget_key] = st.session_state[filter_key]['selected_statuses']
+        
+                selected_statuses = st.multiselect(
+                    "Opening Day Status (can select multiple)",
+                    statuses,
+                    default=st.session_state[widget_key],
+                    help="Select one or more opening day statuses. Shows players with ANY of these statuses.",
+                    key=widget_key
+                )
+                # Update our filter state from widget's session state
+                st.session_state[filter_key]['selected_statuses'] = st.session_state[widget_key]
+            else:
+                selected_statuses = []
+        
+        with col4:
+            # Search by player name
             # Widget with key automatically manages its own session state
-            widget_key = f"filter_status_{format_type}"
+            widget_key = f"filter_search_{format_type}"
             if widget_key not in st.session_state:
-                st.session_state[widget_key] = st.session_state[filter_key]['selected_statuses']
-            
-            selected_statuses = st.multiselect(
-                "Opening Day Status (can select multiple)",
-                statuses,
-                default=st.session_state[widget_key],
-                help="Select one or more opening day statuses. Shows players with ANY of these statuses.",
+                st.session_state[widget_key] = st.session_state[filter_key]['search_name']
+        
+            search_name = st.text_input(
+                "Search Player Name", 
+                value=st.session_state[widget_key],
                 key=widget_key
             )
             # Update our filter state from widget's session state
-            st.session_state[filter_key]['selected_statuses'] = st.session_state[widget_key]
-        else:
-            selected_statuses = []
-    
-    with col4:
-        # Search by player name
-        # Widget with key automatically manages its own session state
-        widget_key = f"filter_search_{format_type}"
-        if widget_key not in st.session_state:
-            st.session_state[widget_key] = st.session_state[filter_key]['search_name']
+            st.session_state[filter_key]['search_name'] = st.session_state[widget_key]
         
-        search_name = st.text_input(
-            "Search Player Name", 
-            value=st.session_state[widget_key],
-            key=widget_key
-        )
-        # Update our filter state from widget's session state
-        st.session_state[filter_key]['search_name'] = st.session_state[widget_key]
+        st.form_submit_button("Apply Filters")
     
     # DRAFT STATUS - Get drafted players from DynamoDB (cached)
     drafted_player_ids = get_drafted_players(draft_table, draft_session_id)
@@ -565,8 +841,9 @@ def render_filters_and_apply(df, draft_table, draft_session_id):
     
     # Add drafted status columns to dataframe
     if 'id' in df.columns:
-        df['Drafted'] = df['id'].astype(str).isin(drafted_player_ids)
-        df['My Team'] = df['id'].astype(str).isin(my_team_player_ids)
+        # id is normalized to strings at load time, so this is a direct hash lookup
+        df['Drafted'] = df['id'].isin(drafted_player_ids)
+        df['My Team'] = df['id'].isin(my_team_player_ids)
     
     # Filter by draft status
     # Widget with key automatically manages its own session state
@@ -593,43 +870,236 @@ def render_filters_and_apply(df, draft_table, draft_session_id):
     st.session_state[filter_key]['draft_filter'] = st.session_state[widget_key]
     
     # Apply filters to the dataframe
-    filtered_df = df.copy()
+    # Build one boolean mask and index the dataframe once at the end, instead of
+    # copying the dataframe and creating a new filtered copy after every filter
+    mask = pd.Series(True, index=df.index)
     
     # Filter by position
-    if selected_positions and 'pos' in filtered_df.columns:
-        mask = filtered_df['pos'].astype(str).apply(
-            lambda pos: any(sel_pos in str(pos) for sel_pos in selected_positions)
-        )
-        filtered_df = filtered_df[mask]
+    if selected_positions and 'pos_mask' in df.columns:
+        # pos_mask bits follow positions_list order (see build_position_mask), so
+        # any selected position matches with one vectorized AND
+        selected_bits = np.uint64(sum(1 << positions_list.index(p) for p in selected_positions))
+        mask &= (df['pos_mask'].to_numpy() & selected_bits) != 0
     
     # Filter by team
-    if selected_teams and 'team' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['team'].isin(selected_teams)]
+    if selected_teams and 'team' in df.columns:
+        mask &= df['team'].isin(selected_teams)
     
     # Filter by projected opening day status
-    if selected_statuses and 'projected_opening_day_status' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['projected_opening_day_status'].isin(selected_statuses)]
+    if selected_statuses and 'projected_opening_day_status' in df.columns:
+        mask &= df['projected_opening_day_status'].isin(selected_statuses)
     
     # Search by name
-    if search_name and 'name' in filtered_df.columns:
-        filtered_df = filtered_df[
-            filtered_df['name'].str.contains(search_name, case=False, na=False)
-        ]
+    if search_name and 'name_lower' in df.columns:
+        # Literal match (regex=False) so characters like '.' in names aren't treated as regex
+        mask &= df['name_lower'].str.contains(search_name.lower(), regex=False, na=False)
     
     # Filter by draft status
-    if draft_filter == "Drafted Only" and 'Drafted' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['Drafted'] == True]
-    elif draft_filter == "Undrafted Only" and 'Drafted' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['Drafted'] == False]
-    elif draft_filter == "My Team Only" and 'My Team' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['My Team'] == True]
+    if draft_filter == "Drafted Only" and 'Drafted' in df.columns:
+        mask &= df['Drafted']
+    elif draft_filter == "Undrafted Only" and 'Drafted' in df.columns:
+        mask &= ~df['Drafted']
+    elif draft_filter == "My Team Only" and 'My Team' in df.columns:
+        mask &= df['My Team']
+    
+    filtered_df = df[mask]
     
     return filtered_df, draft_table
 
-# Display the data if we have it cached
-if st.session_state[cache_key] is not None:
-    df = st.session_state[cache_key].copy()  # Make a copy so we don't modify the cached data
-    cached_time = st.session_state[timestamp_key]
+# ADP chart page, rendered as a fragment: changing the chart's own inputs
+# ("Number of Players to Show", "My Upcoming Pick") reruns only this function,
+# not the whole script (no Athena/DynamoDB reads, filters, or table rebuild)
+@st.fragment
+def render_adp_chart(filtered_df):
+    """Render the ADP chart for the filtered players"""
+    st.markdown("---")
+    st.subheader(f"ADP Chart: {len(filtered_df)} players")
+    
+    # Filter for number of players to show (ADP chart only)
+    max_players_key = f"adp_chart_max_players_{format_type}"
+    
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        max_players = st.number_input(
+            "Number of Players to Show",
+            min_value=10,
+            max_value=1000,
+            value=50,  # Default value (session state will override if it exists)
+            step=10,
+            help="Limit the chart to show only the top N players by rank",
+            key=max_players_key
+        )
+        # Note: st.number_input with key automatically updates session_state, so we don't need to set it manually
+    
+    with col2:
+        upcoming_pick = st.number_input(
+            "My Upcoming Pick",
+            min_value=1,
+            max_value=1000,
+            value=None,
+            step=1,
+            help="Enter your upcoming draft pick number to see a vertical line on the chart"
+        )
+    
+    # Check if we have the required columns for the chart
+    required_cols = ['name', 'pos', 'adp', 'min_pick', 'max_pick']
+    missing_cols = [col for col in required_cols if col not in filtered_df.columns]
+    
+    if missing_cols:
+        st.error(f"Missing required columns for chart: {', '.join(missing_cols)}")
+    else:
+        # Prepare data for chart - only include players with valid ADP data
+        chart_df = filtered_df[
+            filtered_df['adp'].notna() & 
+            filtered_df['min_pick'].notna() & 
+            filtered_df['max_pick'].notna()
+        ].copy()
+        
+        if len(chart_df) == 0:
+            st.warning("No players with ADP data available to display in chart.")
+        else:
+            # Sort by rank for better visualization
+            if 'rank' in chart_df.columns:
+                chart_df = chart_df.sort_values('rank', ascending=True)
+            else:
+                # Fallback to ADP if rank not available
+                chart_df = chart_df.sort_values('adp', ascending=True)
+            
+            # Limit to top N players based on filter
+            chart_df = chart_df.head(max_players)
+            
+            # Create player labels with name and position
+            # Vectorized string concatenation (astype(str) since pos may be categorical)
+            chart_df['player_label'] = (
+                chart_df['name'].astype(str) + ' (' + chart_df['pos'].astype(str) + ')'
+            )
+            
+            # Create the chart using plotly. Imported here rather than at the top of the
+            # file: only this page needs it, so the Draft Table page (and server start)
+            # skip plotly's import cost until the chart is first opened
+            import plotly.graph_objects as go
+            fig = go.Figure()
+            
+            # Draw all players with two traces (one for the whiskers, one for the ADP
+            # markers) instead of two traces per player. Scattergl renders with WebGL
+            # rather than one SVG element per point, which keeps large charts responsive.
+            player_labels = chart_df['player_label'].to_numpy()
+            adp = chart_df['adp'].to_numpy(dtype=np.float64)
+            min_pick = chart_df['min_pick'].to_numpy(dtype=np.float64)
+            max_pick = chart_df['max_pick'].to_numpy(dtype=np.float64)
+            
+            # Add horizontal lines (whiskers) for min and max picks: one min -> max segment
+            # per player, with a NaN point after each so the line breaks between players
+            whisker_x = np.empty(3 * len(chart_df))
+            whisker_x[0::3] = min_pick
+            whisker_x[1::3] = max_pick
+            whisker_x[2::3] = np.nan
+            fig.add_trace(go.Scattergl(
+                x=whisker_x,
+                y=np.repeat(player_labels, 3),
+                mode='lines',
+                line=dict(color='lightblue', width=3),
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+            
+            # Add markers for ADP (center point) - larger and more prominent
+            # Get rank if available
+            if 'rank' in chart_df.columns:
+                rank_values = chart_df['rank']
+                rank_text = np.where(
+                    rank_values.notna(),
+                    'Rank: ' + rank_values.fillna(0).astype(int).astype(str) + '<br>',
+                    ''
+                )
+            else:
+                rank_text = np.full(len(chart_df), '')
+            
+            fig.add_trace(go.Scattergl(
+                x=adp,
+                y=player_labels,
+                mode='markers',
+                marker=dict(
+                    size=10,
+                    color='darkblue',
+                    symbol='circle',
+                    line=dict(color='white', width=1)
+                ),
+                # Object array so the rank text stays a string and the picks stay numbers
+                customdata=np.column_stack([
+                    rank_text.astype(object), min_pick, max_pick, max_pick - min_pick
+                ]),
+                hovertemplate="<b>%{y}</b><br>" +
+                             "%{customdata[0]}" +
+                             "ADP: %{x:.1f}<br>" +
+                             "Min Pick: %{customdata[1]:.0f}<br>" +
+                             "Max Pick: %{customdata[2]:.0f}<br>" +
+                             "Range: %{customdata[3]:.0f} picks<extra></extra>",
+                showlegend=False
+            ))
+            
+            # Add vertical line for upcoming draft pick if specified
+            if upcoming_pick is not None and pd.notna(upcoming_pick):
+                fig.add_vline(
+                    x=upcoming_pick,
+                    line_dash="dash",
+                    line_color="red",
+                    line_width=2,
+                    annotation_text=f"Pick {int(upcoming_pick)}",
+                    annotation_position="top",
+                    annotation=dict(font_size=12, font_color="red")
+                )
+            
+            # Calculate height based on number of players - ensure readable spacing
+            # Use enough height per player so names are visible
+            chart_height = max(400, len(chart_df) * 25)  # 25px per player for readability
+            
+            # Update layout - balance between readability and spacing
+            fig.update_layout(
+                title="ADP Chart (Min Pick - ADP - Max Pick)",
+                xaxis_title="Pick Number",
+                yaxis_title="Player (Position)",
+                height=chart_height,
+                hovermode='closest',
+                margin=dict(l=150, r=50, t=10, b=10),  # Minimal top/bottom margins
+                xaxis=dict(
+                    autorange=True,
+                    showgrid=True,
+                    gridwidth=1,
+                    gridcolor='black',
+                    title_font=dict(color='black', size=12),  # Dark, readable axis title
+                    tickfont=dict(color='black', size=11)  # Dark, readable tick labels
+                ),
+                yaxis=dict(
+                    autorange="reversed",
+                    showgrid=False,
+                    tickfont=dict(color='black', size=11),  # Dark, readable font
+                    title_font=dict(color='black', size=12),  # Dark, readable axis title
+                    # Reduce padding at top and bottom
+                    range=[-0.5, len(chart_df) - 0.5]  # Tight range around data points
+                ),
+                font=dict(size=11, color='black'),  # Dark, readable font
+                paper_bgcolor='white',
+                plot_bgcolor='white'
+            )
+            
+            # Display the chart
+            st.plotly_chart(
+                fig, 
+                use_container_width=True,
+                config={
+                    'displayModeBar': True,
+                    'displaylogo': False,
+                    'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
+                    'scrollZoom': False,  # Enable scroll zoom for mobile
+                    'responsive': True   # Make chart responsive
+                }
+            )
+
+# Display the data if we have it
+if player_data is not None:
+    # No copy needed: each rerun builds its own DataFrame from the cached Arrow table
+    df = player_data
     
     # Format the timestamp nicely
     if cached_time:
@@ -660,6 +1130,15 @@ if st.session_state[cache_key] is not None:
     draft_type_key = f"draft_type_{draft_session_id}"
     current_draft_type = st.session_state.get(draft_type_key, "Live Draft")
     
+    # Pick counter and last picked player for this session and format
+    # (shared by the mock draft, live draft status, and manual drafting below)
+    pick_key = f"current_pick_{draft_session_id}_{format_type}"
+    last_picked_key = f"last_picked_{draft_session_id}_{format_type}"
+    if pick_key not in st.session_state:
+        st.session_state[pick_key] = 1
+    if last_picked_key not in st.session_state:
+        st.session_state[last_picked_key] = None
+    
     # Render different pages based on selection
     if page == "📊 Draft Table":
         # DRAFT TABLE PAGE
@@ -670,15 +1149,6 @@ if st.session_state[cache_key] is not None:
             st.markdown("---")
             st.subheader("Mock Draft Simulation")
             
-            # Initialize current pick in session state
-            pick_key = f"current_pick_{draft_session_id}_{format_type}"
-            last_picked_key = f"last_picked_{draft_session_id}_{format_type}"
-            
-            if pick_key not in st.session_state:
-                st.session_state[pick_key] = 1
-            if last_picked_key not in st.session_state:
-                st.session_state[last_picked_key] = None
-            
             current_pick = st.session_state[pick_key]
             last_picked = st.session_state[last_picked_key]
             
@@ -693,20 +1163,16 @@ if st.session_state[cache_key] is not None:
                     st.info("No picks yet")
             with col3:
                 if st.button("🔄 Reset Mock Draft", help="Reset pick counter and clear all drafted players"):
-                    # Clear all drafted players from DynamoDB
+                    # Clear all drafted players from DynamoDB. Rescan first (force_refresh)
+                    # instead of using the local draft state, so picks made on other
+                    # devices since the last scan are cleared too
                     try:
                         drafted_ids = get_drafted_players(draft_table, draft_session_id, force_refresh=True)
-                        for player_id in drafted_ids:
-                            mark_player_undrafted(draft_table, player_id)
-                        # Clear cache after reset
-                        if f"drafted_players_{draft_session_id}" in st.session_state:
-                            del st.session_state[f"drafted_players_{draft_session_id}"]
-                        if f"my_team_players_{draft_session_id}" in st.session_state:
-                            del st.session_state[f"my_team_players_{draft_session_id}"]
-                        st.session_state[pick_key] = 1
-                        st.session_state[last_picked_key] = None
-                        st.success("Mock draft reset! All players cleared.")
-                        st.rerun()
+                        if mark_players_undrafted(draft_table, drafted_ids):
+                            st.session_state[pick_key] = 1
+                            st.session_state[last_picked_key] = None
+                            st.success("Mock draft reset! All players cleared.")
+                            st.rerun()
                     except Exception as e:
                         st.error(f"Error resetting draft: {str(e)}")
         
@@ -717,7 +1183,7 @@ if st.session_state[cache_key] is not None:
                 undrafted_df = filtered_df[
                     (filtered_df.get('Drafted', False) == False) & 
                     (filtered_df.get('My Team', False) == False)
-                ].copy()
+                ]
                 
                 # Filter to players with ADP data
                 if 'adp' in undrafted_df.columns and 'min_pick' in undrafted_df.columns and 'max_pick' in undrafted_df.columns:
@@ -725,73 +1191,57 @@ if st.session_state[cache_key] is not None:
                         undrafted_df['adp'].notna() & 
                         undrafted_df['min_pick'].notna() & 
                         undrafted_df['max_pick'].notna()
-                    ].copy()
+                    ]
                     
                     if len(players_with_adp) > 0:
                         # Calculate draft probabilities
                         # Use normal distribution centered on ADP, with variance based on range
                         # Allow ~15% probability outside min/max range (reaches and falls happen)
-                        probabilities = []
-                        player_ids = []
-                        player_names = []
+                        # Computed for all players at once as NumPy arrays (no per-player loop)
+                        adp = players_with_adp['adp'].to_numpy(dtype=np.float64)
+                        min_pick = players_with_adp['min_pick'].to_numpy(dtype=np.float64)
+                        max_pick = players_with_adp['max_pick'].to_numpy(dtype=np.float64)
                         
-                        for _, player in players_with_adp.iterrows():
-                            adp = player['adp']
-                            min_pick = player['min_pick']
-                            max_pick = player['max_pick']
-                            player_id = str(player['id'])
-                            player_name = player.get('name', 'Unknown')
-                            
-                            # Calculate variance based on range
-                            range_size = max_pick - min_pick
-                            std_dev = max(range_size / 3, 3)  # Minimum std_dev of 3
-                            
-                            # Base probability using normal distribution centered on ADP
-                            base_prob = np.exp(-0.5 * ((current_pick - adp) / std_dev) ** 2)
-                            
-                            # Apply range constraints and urgency factors
-                            if current_pick < min_pick:
+                        # Calculate variance based on range
+                        std_dev = np.maximum((max_pick - min_pick) / 3, 3)  # Minimum std_dev of 3
+                        
+                        # Base probability using normal distribution centered on ADP
+                        base_prob = np.exp(-0.5 * ((current_pick - adp) / std_dev) ** 2)
+                        
+                        # Apply range constraints and urgency factors (first matching case wins)
+                        probabilities = np.select(
+                            [
                                 # Too early - very low probability, only if very close
-                                distance_before_min = min_pick - current_pick
-                                if distance_before_min <= 2:
-                                    prob = base_prob * 0.1  # 10% if within 2 picks
-                                else:
-                                    prob = 0.0001  # Essentially zero
-                            elif current_pick > max_pick:
+                                current_pick < min_pick,
                                 # Past max_pick - player is overdue, boost probability significantly
-                                distance_after_max = current_pick - max_pick
-                                # Urgency factor: the further past max, the higher the urgency
-                                urgency_factor = 1 + (distance_after_max * 2)  # Exponential urgency
-                                prob = base_prob * urgency_factor * 10  # Strong boost for overdue players
-                            elif current_pick >= max_pick - 2:
+                                current_pick > max_pick,
                                 # Approaching max_pick (within 2 picks) - increase urgency
-                                distance_to_max = max_pick - current_pick
-                                urgency_factor = 1 + (2 - distance_to_max) * 0.5  # Increasing urgency
-                                prob = base_prob * urgency_factor
-                            else:
-                                # Within normal range - use base probability
-                                prob = base_prob
-                            
-                            probabilities.append(prob)
-                            player_ids.append(player_id)
-                            player_names.append(player_name)
+                                current_pick >= max_pick - 2
+                            ],
+                            [
+                                # 10% if within 2 picks of min_pick, otherwise essentially zero
+                                np.where(min_pick - current_pick <= 2, base_prob * 0.1, 0.0001),
+                                # Urgency factor: the further past max, the higher the urgency
+                                base_prob * (1 + (current_pick - max_pick) * 2) * 10,
+                                base_prob * (1 + (2 - (max_pick - current_pick)) * 0.5)
+                            ],
+                            # Within normal range - use base probability
+                            default=base_prob
+                        )
                         
                         # Normalize probabilities
-                        total_prob = sum(probabilities)
+                        total_prob = probabilities.sum()
                         if total_prob > 0:
-                            probabilities = [p / total_prob for p in probabilities]
+                            probabilities = probabilities / total_prob
                             
                             # Select player using weighted random choice
-                            selected_idx = np.random.choice(len(player_ids), p=probabilities)
-                            selected_player_id = player_ids[selected_idx]
-                            selected_player_name = player_names[selected_idx]
+                            selected_idx = get_pick_rng().choice(len(probabilities), p=probabilities)
+                            selected_player = players_with_adp.iloc[selected_idx]
+                            selected_player_id = selected_player['id']
+                            selected_player_name = selected_player.get('name', 'Unknown')
                             
                             # Mark player as drafted
                             if mark_player_drafted(draft_table, selected_player_id, selected_player_name):
-                                # Clear DynamoDB cache since we just made a change
-                                cache_key_drafted = f"drafted_players_{draft_session_id}"
-                                if cache_key_drafted in st.session_state:
-                                    del st.session_state[cache_key_drafted]
                                 # Update session state
                                 st.session_state[pick_key] = current_pick + 1
                                 st.session_state[last_picked_key] = selected_player_name
@@ -802,15 +1252,11 @@ if st.session_state[cache_key] is not None:
                     else:
                         # No players with ADP data - select randomly from remaining
                         if len(undrafted_df) > 0:
-                            selected_player = undrafted_df.sample(n=1).iloc[0]
-                            selected_player_id = str(selected_player['id'])
+                            selected_player = undrafted_df.sample(n=1, random_state=get_pick_rng()).iloc[0]
+                            selected_player_id = selected_player['id']
                             selected_player_name = selected_player.get('name', 'Unknown')
                             
                             if mark_player_drafted(draft_table, selected_player_id, selected_player_name):
-                                # Clear DynamoDB cache since we just made a change
-                                cache_key_drafted = f"drafted_players_{draft_session_id}"
-                                if cache_key_drafted in st.session_state:
-                                    del st.session_state[cache_key_drafted]
                                 st.session_state[pick_key] = current_pick + 1
                                 st.session_state[last_picked_key] = selected_player_name
                                 st.success(f"✅ Pick {current_pick}: **{selected_player_name}** has been drafted!")
@@ -825,15 +1271,6 @@ if st.session_state[cache_key] is not None:
             st.markdown("---")
             st.subheader("Draft Status")
             
-            # Initialize current pick in session state (for tracking)
-            pick_key = f"current_pick_{draft_session_id}_{format_type}"
-            last_picked_key = f"last_picked_{draft_session_id}_{format_type}"
-            
-            if pick_key not in st.session_state:
-                st.session_state[pick_key] = 1
-            if last_picked_key not in st.session_state:
-                st.session_state[last_picked_key] = None
-            
             current_pick = st.session_state[pick_key]
             last_picked = st.session_state[last_picked_key]
             
@@ -850,44 +1287,15 @@ if st.session_state[cache_key] is not None:
         
         # TEAM STATS COMPARISON CHART
         # Get players on my team (use full dataset, not filtered - team stats should always show regardless of filters)
-        my_team_df = df[df.get('My Team', False) == True].copy() if 'My Team' in df.columns else pd.DataFrame()
+        # Read-only selection, so no copy of the cached rows is needed
+        my_team_df = df[df['My Team']] if 'My Team' in df.columns else pd.DataFrame()
         
         if len(my_team_df) > 0:
             st.subheader("My Team Stats vs Percentiles")
             
             try:
-                # Query percentiles table to get the right format and max year
-                conn = connect(
-                    s3_staging_dir=ATHENA_S3_OUTPUT,
-                    region_name=ATHENA_REGION,
-                    schema_name=ATHENA_SCHEMA,
-                    cursor_class=PandasCursor
-                )
-                
-                # Get percentiles for the selected format and max year
-                percentiles_query = f"""
-                WITH filename_parts AS (
-                    SELECT 
-                        _filename,
-                        category,
-                        p80,
-                        p90,
-                        -- Extract format (after first space) and year (after second space)
-                        split_part(_filename, ' ', 2) as format_part,
-                        cast(split_part(_filename, ' ', 3) as int) as year_part
-                    FROM {ATHENA_SCHEMA}.mart_sgp_percentiles
-                )
-                SELECT 
-                    category,
-                    p80,
-                    p90
-                FROM filename_parts
-                WHERE format_part = '{format_type}'
-                AND year_part = (SELECT max(year_part) FROM filename_parts WHERE format_part = '{format_type}')
-                """
-                
-                cursor = conn.cursor()
-                percentiles_df = cursor.execute(percentiles_query).as_pandas()
+                # Percentiles for the selected format and max year (cached per format)
+                percentiles_df = load_sgp_percentiles(format_type)
                 
                 if len(percentiles_df) > 0:
                     # Aggregate my team stats
@@ -906,35 +1314,50 @@ if st.session_state[cache_key] is not None:
                     }
                     
                     # Calculate aggregated team stats
+                    # Sum every needed column in one pass up front, so the loop below only
+                    # picks values out instead of re-scanning my_team_df. sum() and
+                    # np.nansum skip missing values, which counts them as 0 without
+                    # allocating fillna(0) copies.
+                    stat_columns = [
+                        col for col in list(category_mapping.values()) + ['ab', 'ip']
+                        if col in my_team_df.columns
+                    ]
+                    column_sums = my_team_df[stat_columns].sum()
+                    
+                    # AVG = H / AB, with hits recovered from avg * ab per player
+                    if 'avg' in stat_columns and 'ab' in stat_columns:
+                        total_h = np.nansum(
+                            my_team_df['ab'].to_numpy(dtype=np.float64) * my_team_df['avg'].to_numpy(dtype=np.float64)
+                        )
+                    # ERA and WHIP are weighted averages by IP: sum(stat * ip) / sum(ip)
+                    if 'ip' in stat_columns:
+                        team_ip = my_team_df['ip'].to_numpy(dtype=np.float64)
+                        weighted_sums = {
+                            col: np.nansum(my_team_df[col].to_numpy(dtype=np.float64) * team_ip)
+                            for col in ['era', 'whip'] if col in stat_columns
+                        }
+                    total_ab = column_sums.get('ab', 0)
+                    total_ip = column_sums.get('ip', 0)
+                    
                     team_stats = {}
                     for percentile_cat, stat_col in category_mapping.items():
-                        if stat_col in my_team_df.columns:
-                            if stat_col == 'avg':
-                                # AVG = H / AB - need to aggregate properly
-                                if 'ab' in my_team_df.columns:
-                                    # Calculate total hits from avg and ab, then recalculate
-                                    total_h = (my_team_df['ab'].fillna(0) * my_team_df['avg'].fillna(0)).sum()
-                                    total_ab = my_team_df['ab'].fillna(0).sum()
-                                    team_stats[percentile_cat] = total_h / total_ab if total_ab > 0 else 0
-                                else:
-                                    # Fallback to simple average if AB not available
-                                    team_stats[percentile_cat] = my_team_df[stat_col].mean() if len(my_team_df) > 0 else 0
-                            elif stat_col in ['era', 'whip']:
-                                # For ERA and WHIP, aggregate as weighted average by IP
-                                if 'ip' in my_team_df.columns:
-                                    total_ip = my_team_df['ip'].fillna(0).sum()
-                                    if total_ip > 0:
-                                        # Weighted average: sum(stat * ip) / sum(ip)
-                                        weighted_sum = (my_team_df[stat_col].fillna(0) * my_team_df['ip'].fillna(0)).sum()
-                                        team_stats[percentile_cat] = weighted_sum / total_ip
-                                    else:
-                                        team_stats[percentile_cat] = my_team_df[stat_col].mean() if len(my_team_df) > 0 else 0
-                                else:
-                                    # Fallback to simple average if IP not available
-                                    team_stats[percentile_cat] = my_team_df[stat_col].mean() if len(my_team_df) > 0 else 0
+                        if stat_col not in stat_columns:
+                            continue
+                        if stat_col == 'avg':
+                            if 'ab' in stat_columns:
+                                team_stats[percentile_cat] = total_h / total_ab if total_ab > 0 else 0
+                            else:
+                                # Fallback to simple average if AB not available
+                                team_stats[percentile_cat] = my_team_df[stat_col].mean()
+                        elif stat_col in ['era', 'whip']:
+                            if 'ip' in stat_columns and total_ip > 0:
+                                team_stats[percentile_cat] = weighted_sums[stat_col] / total_ip
                             else:
-                                # Counting stats (R, HR, RBI, SB, K, W, sv) - sum them
-                                team_stats[percentile_cat] = my_team_df[stat_col].fillna(0).sum()
+                                # Fallback to simple average if IP not available
+                                team_stats[percentile_cat] = my_team_df[stat_col].mean()
+                        else:
+                            # Counting stats (R, HR, RBI, SB, K, W, sv) - sum them
+                            team_stats[percentile_cat] = column_sums[stat_col]
                     
                     # Define category order
                     category_order = ['R', 'HR', 'RBI', 'SB', 'AVG', 'K', 'W', 'SV', 'ERA', 'WHIP']
@@ -948,6 +1371,14 @@ if st.session_state[cache_key] is not None:
                     # Create a mapping from percentile category to display name
                     category_display_map = {'S': 'SV'}  # Map S to SV for display
                     
+                    # Look up percentiles by category from a dict instead of filtering
+                    # percentiles_df once per category
+                    percentiles_by_category = (
+                        percentiles_df.drop_duplicates('category')
+                        .set_index('category')[['p80', 'p90']]
+                        .to_dict('index')
+                    )
+                    
                     # Build data in the specified order
                     for cat in category_order:
                         # Check if this category exists in percentiles (handle S -> SV mapping)
@@ -958,49 +1389,31 @@ if st.session_state[cache_key] is not None:
                             team_values.append(team_stats[percentile_cat])
                             
                             # Get percentile values
-                            percentile_row = percentiles_df[percentiles_df['category'] == percentile_cat]
-                            if len(percentile_row) > 0:
-                                p80_values.append(percentile_row.iloc[0]['p80'])
-                                p90_values.append(percentile_row.iloc[0]['p90'])
+                            percentile_row = percentiles_by_category.get(percentile_cat)
+                            if percentile_row is not None:
+                                p80_values.append(percentile_row['p80'])
+                                p90_values.append(percentile_row['p90'])
                             else:
                                 p80_values.append(0)
                                 p90_values.append(0)
                     
                     if len(categories) > 0:
                         # Create transposed comparison table (categories as columns, percentiles as rows)
-                        # Initialize data structure for transposed table
-                        p80_row = {}
-                        p90_row = {}
-                        team_row = {}
+                        comparison_values = pd.DataFrame(
+                            [p80_values, p90_values, team_values],
+                            columns=categories
+                        )
                         
-                        for cat, team_val, p80_val, p90_val in zip(categories, team_values, p80_values, p90_values):
-                            # Format values based on category type
+                        # Format values based on category type, a whole column at a time
+                        comparison_df = pd.DataFrame({'Metric': ['80th Percentile', '90th Percentile', 'My Team']})
+                        for cat in categories:
                             if cat == 'AVG':
-                                team_str = f'{team_val:.3f}'
-                                p80_str = f'{p80_val:.3f}'
-                                p90_str = f'{p90_val:.3f}'
+                                comparison_df[cat] = comparison_values[cat].map('{:.3f}'.format)
                             elif cat in ['ERA', 'WHIP']:
-                                team_str = f'{team_val:.2f}'
-                                p80_str = f'{p80_val:.2f}'
-                                p90_str = f'{p90_val:.2f}'
+                                comparison_df[cat] = comparison_values[cat].map('{:.2f}'.format)
                             else:
-                                team_str = f'{int(team_val)}'
-                                p80_str = f'{int(p80_val)}'
-                                p90_str = f'{int(p90_val)}'
-                            
-                            # Add to each row
-                            p80_row[cat] = p80_str
-                            p90_row[cat] = p90_str
-                            team_row[cat] = team_str
-                        
-                        # Create transposed dataframe with categories as columns
-                        comparison_data = [
-                            {'Metric': '80th Percentile', **p80_row},
-                            {'Metric': '90th Percentile', **p90_row},
-                            {'Metric': 'My Team', **team_row}
-                        ]
-                        
-                        comparison_df = pd.DataFrame(comparison_data)
+                                # Whole numbers (truncated, not rounded)
+                                comparison_df[cat] = comparison_values[cat].astype(int).astype(str)
                         
                         # Configure column widths to make them narrower
                         column_config = {
@@ -1063,39 +1476,45 @@ if st.session_state[cache_key] is not None:
         
         # Only include columns that exist in the dataframe
         available_columns = [col for col in desired_columns if col in filtered_df.columns]
-        display_df = filtered_df[available_columns].copy()
         
         # Limit the display dataframe only (not the underlying filtered_df used for charts/calculations)
         # This way charts, team stats, and filtering still work with all data
-        original_count = len(display_df)
-        if original_count > row_limit:
-            display_df = display_df.head(row_limit)
-            st.info(f"⚠️ Showing first {row_limit} of {original_count} filtered players in table. Charts and stats use all {original_count} players. Adjust 'Max Rows to Display' to see more.")
-        
-        # Apply rounding to numeric columns
-        # Round to whole numbers
-        whole_number_cols = ['pa', 'ab', 'r', 'hr', 'rbi', 'sb', 'ip', 'k', 'w', 'sv']
-        for col in whole_number_cols:
-            if col in display_df.columns:
-                display_df[col] = display_df[col].round(0).astype('Int64')  # Int64 allows NaN
+        # Rows are already in rank order from the loader, so slicing is enough (no sort needed),
+        # and we only copy the rows on the current page
+        original_count = len(filtered_df)
         
-        # Round to 3 decimal places (.000)
-        three_decimal_cols = ['avg', 'obp', 'slg']
-        for col in three_decimal_cols:
-            if col in display_df.columns:
-                display_df[col] = display_df[col].round(3)
-        
-        # Round to 2 decimal places (.00)
-        two_decimal_cols = ['era', 'whip']
-        for col in two_decimal_cols:
-            if col in display_df.columns:
-                display_df[col] = display_df[col].round(2)
-        
-        # Format value as currency with cents
-        if 'value' in display_df.columns:
-            display_df['value'] = display_df['value'].apply(
-                lambda x: f"${float(x):,.2f}" if pd.notna(x) and pd.notnull(x) else ""
+        # Page through the filtered players instead of sending them all to the browser
+        page_start = 0
+        num_pages = max(1, -(-original_count // row_limit))
+        if num_pages > 1:
+            page_key = f"table_page_{format_type}"
+            # The widget's value lives only in session_state (no value=), and its label
+            # and bounds don't depend on the page count, so a filter change that changes
+            # num_pages doesn't rebuild the widget and send it back to page 1.
+            # Keep the stored page in range when filters shrink the results
+            if st.session_state.get(page_key, 1) > num_pages:
+                st.session_state[page_key] = num_pages
+            elif page_key not in st.session_state:
+                st.session_state[page_key] = 1
+            table_page = st.number_input(
+                "Page",
+                min_value=1,
+                step=1,
+                key=page_key
             )
+            st.caption(f"of {num_pages} pages")
+            table_page = min(table_page, num_pages)
+            page_start = (table_page - 1) * row_limit
+        
+        page_df = filtered_df[available_columns].iloc[page_start:page_start + row_limit]
+        page_ids = tuple(page_df['id']) if 'id' in page_df.columns else tuple(page_df.index)
+        display_df = format_display_df(table_name, cached_time, page_ids, page_df)
+        for status_col in ['Drafted', 'My Team']:
+            if status_col in display_df.columns:
+                display_df[status_col] = page_df[status_col].to_numpy()
+        if original_count > row_limit:
+            page_end = min(page_start + row_limit, original_count)
+            st.info(f"⚠️ Showing players {page_start + 1}-{page_end} of {original_count} filtered players in table. Charts and stats use all {original_count} players. Change the page or adjust 'Max Rows to Display' to see more.")
         
         # Use st.data_editor with column configuration
         # Both "Drafted" and "My Team" columns should be editable (as checkboxes)
@@ -1128,88 +1547,44 @@ if st.session_state[cache_key] is not None:
         )
         
         # Check if any draft status changed and update DynamoDB
-        # Note: We need to work with the original filtered_df for player lookups since display_df has formatted values
         if ('Drafted' in edited_df.columns or 'My Team' in edited_df.columns) and 'id' in edited_df.columns:
-            # Create dictionaries of original statuses for comparison
-            # Use filtered_df to get original values (before formatting)
-            original_drafted = {}
-            original_my_team = {}
-            if 'Drafted' in filtered_df.columns and 'id' in filtered_df.columns:
-                for _, row in filtered_df.iterrows():
-                    player_id = str(row['id'])
-                    # Match by id to get original status
-                    original_drafted[player_id] = row['Drafted']
-            if 'My Team' in filtered_df.columns and 'id' in filtered_df.columns:
-                for _, row in filtered_df.iterrows():
-                    player_id = str(row['id'])
-                    original_my_team[player_id] = row['My Team']
+            # display_df holds the original statuses, row for row with edited_df
+            # (data_editor returns the rows in the order it was given), so compare
+            # the checkbox columns as arrays and only visit the rows that changed
+            changed_mask = np.zeros(len(edited_df), dtype=bool)
+            for status_col in ['Drafted', 'My Team']:
+                if status_col in edited_df.columns:
+                    changed_mask |= edited_df[status_col].to_numpy() != display_df[status_col].to_numpy()
             
-            # Check each row in edited dataframe
-            changes_made = False
+            # Work out each changed player's final state, then write them all in one batch
+            draft_changes = []
             newly_drafted_players = []  # Track newly drafted players for "Last Picked" display
             
-            for _, row in edited_df.iterrows():
-                player_id = str(row['id'])
+            for row_idx in np.flatnonzero(changed_mask):
+                row = edited_df.iloc[row_idx]
+                original_row = display_df.iloc[row_idx]
+                player_id = row['id']
                 player_name = row.get('name', 'Unknown')
                 
                 new_drafted = row.get('Drafted', False) if 'Drafted' in edited_df.columns else False
                 new_my_team = row.get('My Team', False) if 'My Team' in edited_df.columns else False
-                original_drafted_status = original_drafted.get(player_id, False)
-                original_my_team_status = original_my_team.get(player_id, False)
+                original_drafted_status = original_row.get('Drafted', False)
                 
-                # Priority 1: Handle "My Team" changes
-                # If checked, mark as my team AND as drafted
-                # If unchecked, just unmark as my team (keep drafted status)
-                if 'My Team' in edited_df.columns:
-                    if new_my_team != original_my_team_status:
-                        mark_player_to_my_team(draft_table, player_id, player_name, new_my_team)
-                        changes_made = True
-                        # If marking as my team, ensure drafted is also true
-                        if new_my_team and not new_drafted:
-                            mark_player_drafted(draft_table, player_id, player_name)
-                            # Track if this is a newly drafted player
-                            if not original_drafted_status:
-                                newly_drafted_players.append(player_name)
-                
-                # Priority 2: Handle "Drafted" changes
-                # If unchecked, also uncheck my team (can't be on my team if not drafted)
-                if 'Drafted' in edited_df.columns:
-                    if new_drafted != original_drafted_status:
-                        if new_drafted:
-                            mark_player_drafted(draft_table, player_id, player_name)
-                            # Track if this is a newly drafted player
-                            if not original_drafted_status:
-                                newly_drafted_players.append(player_name)
-                        else:
-                            # If unchecking drafted, delete from DynamoDB (which removes both drafted and my team status)
-                            mark_player_undrafted(draft_table, player_id)
-                        changes_made = True
+                # Unchecking Drafted removes the player (which removes both drafted and
+                # my team status - can't be on my team if not drafted). Any other change
+                # leaves the player drafted: checking My Team also marks them as drafted,
+                # and unchecking it keeps the drafted status.
+                if 'Drafted' in edited_df.columns and original_drafted_status and not new_drafted:
+                    draft_changes.append((player_id, player_name, False, False))
+                else:
+                    draft_changes.append((player_id, player_name, True, bool(new_my_team)))
+                    # Track if this is a newly drafted player
+                    if not original_drafted_status:
+                        newly_drafted_players.append(player_name)
+            
+            changes_made = len(draft_changes) > 0 and write_draft_changes(draft_table, draft_changes)
             
-            # Update pick counter based on total drafted players (for both mock and live drafts)
             if changes_made:
-                # Clear DynamoDB cache since we just made changes
-                cache_key_drafted = f"drafted_players_{draft_session_id}"
-                cache_key_my_team = f"my_team_players_{draft_session_id}"
-                if cache_key_drafted in st.session_state:
-                    del st.session_state[cache_key_drafted]
-                if cache_key_my_team in st.session_state:
-                    del st.session_state[cache_key_my_team]
-                
-                pick_key = f"current_pick_{draft_session_id}_{format_type}"
-                last_picked_key = f"last_picked_{draft_session_id}_{format_type}"
-                
-                # Initialize pick counter if it doesn't exist
-                if pick_key not in st.session_state:
-                    st.session_state[pick_key] = 1
-                if last_picked_key not in st.session_state:
-                    st.session_state[last_picked_key] = None
-                
-                # Calculate pick counter based on total drafted players + 1
-                # This ensures accuracy even if players are unchecked
-                # We query DynamoDB to get the current count (force refresh to get latest)
-                total_drafted_count = len(get_drafted_players(draft_table, draft_session_id, force_refresh=True))
-                st.session_state[pick_key] = total_drafted_count + 1
-                
                 # Update last picked player (only if someone was just drafted)
                 if newly_drafted_players:
                     st.session_state[last_picked_key] = newly_drafted_players[-1]
@@ -1222,171 +1597,4 @@ if st.session_state[cache_key] is not None:
     
     elif page == "📈 ADP Chart":
         # ADP CHART PAGE
-        st.markdown("---")
-        st.subheader(f"ADP Chart: {len(filtered_df)} players")
-        
-        # Filter for number of players to show (ADP chart only)
-        max_players_key = f"adp_chart_max_players_{format_type}"
-        
-        col1, col2 = st.columns([1, 1])
-        with col1:
-            max_players = st.number_input(
-                "Number of Players to Show",
-                min_value=10,
-                max_value=1000,
-                value=50,  # Default value (session state will override if it exists)
-                step=10,
-                help="Limit the chart to show only the top N players by rank",
-                key=max_players_key
-            )
-            # Note: st.number_input with key automatically updates session_state, so we don't need to set it manually
-        
-        with col2:
-            upcoming_pick = st.number_input(
-                "My Upcoming Pick",
-                min_value=1,
-                max_value=1000,
-                value=None,
-                step=1,
-                help="Enter your upcoming draft pick number to see a vertical line on the chart"
-            )
-        
-        # Check if we have the required columns for the chart
-        required_cols = ['name', 'pos', 'adp', 'min_pick', 'max_pick']
-        missing_cols = [col for col in required_cols if col not in filtered_df.columns]
-        
-        if missing_cols:
-            st.error(f"Missing required columns for chart: {', '.join(missing_cols)}")
-        else:
-            # Prepare data for chart - only include players with valid ADP data
-            chart_df = filtered_df[
-                filtered_df['adp'].notna() & 
-                filtered_df['min_pick'].notna() & 
-                filtered_df['max_pick'].notna()
-            ].copy()
-            
-            if len(chart_df) == 0:
-                st.warning("No players with ADP data available to display in chart.")
-            else:
-                # Sort by rank for better visualization
-                if 'rank' in chart_df.columns:
-                    chart_df = chart_df.sort_values('rank', ascending=True)
-                else:
-                    # Fallback to ADP if rank not available
-                    chart_df = chart_df.sort_values('adp', ascending=True)
-                
-                # Limit to top N players based on filter
-                chart_df = chart_df.head(max_players)
-                
-                # Create player labels with name and position
-                chart_df['player_label'] = chart_df.apply(
-                    lambda row: f"{row['name']} ({row['pos']})", axis=1
-                )
-                
-                # Create the chart using plotly
-                fig = go.Figure()
-                
-                # Add horizontal lines (whiskers) for min and max picks with ADP marker
-                for idx, row in chart_df.iterrows():
-                    player_label = row['player_label']
-                    adp = row['adp']
-                    min_pick = row['min_pick']
-                    max_pick = row['max_pick']
-                    
-                    # Add line from min to max (whisker/range line)
-                    fig.add_trace(go.Scatter(
-                        x=[min_pick, max_pick],
-                        y=[player_label, player_label],
-                        mode='lines',
-                        line=dict(color='lightblue', width=3),
-                        showlegend=False,
-                        hoverinfo='skip'
-                    ))
-                    
-                    # Add marker for ADP (center point) - larger and more prominent
-                    # Get rank if available
-                    rank_text = ""
-                    if 'rank' in row:
-                        rank_value = row['rank']
-                        if pd.notna(rank_value):
-                            rank_text = f"Rank: {int(rank_value)}<br>"
-                    
-                    fig.add_trace(go.Scatter(
-                        x=[adp],
-                        y=[player_label],
-                        mode='markers',
-                        marker=dict(
-                            size=10,
-                            color='darkblue',
-                            symbol='circle',
-                            line=dict(color='white', width=1)
-                        ),
-                        name=player_label,
-                        hovertemplate=f"<b>{player_label}</b><br>" +
-                                     rank_text +
-                                     f"ADP: {adp:.1f}<br>" +
-                                     f"Min Pick: {min_pick:.0f}<br>" +
-                                     f"Max Pick: {max_pick:.0f}<br>" +
-                                     f"Range: {max_pick - min_pick:.0f} picks<extra></extra>",
-                        showlegend=False
-                    ))
-                
-                # Add vertical line for upcoming draft pick if specified
-                if upcoming_pick is not None and pd.notna(upcoming_pick):
-                    # Get the y-axis range from the player labels
-                    y_values = chart_df['player_label'].tolist()
-                    fig.add_vline(
-                        x=upcoming_pick,
-                        line_dash="dash",
-                        line_color="red",
-                        line_width=2,
-                        annotation_text=f"Pick {int(upcoming_pick)}",
-                        annotation_position="top",
-                        annotation=dict(font_size=12, font_color="red")
-                    )
-                
-                # Calculate height based on number of players - ensure readable spacing
-                # Use enough height per player so names are visible
-                chart_height = max(400, len(chart_df) * 25)  # 25px per player for readability
-                
-                # Update layout - balance between readability and spacing
-                fig.update_layout(
-                    title="ADP Chart (Min Pick - ADP - Max Pick)",
-                    xaxis_title="Pick Number",
-                    yaxis_title="Player (Position)",
-                    height=chart_height,
-                    hovermode='closest',
-                    margin=dict(l=150, r=50, t=10, b=10),  # Minimal top/bottom margins
-                    xaxis=dict(
-                        autorange=True,
-                        showgrid=True,
-                        gridwidth=1,
-                        gridcolor='black',
-                        title_font=dict(color='black', size=12),  # Dark, readable axis title
-                        tickfont=dict(color='black', size=11)  # Dark, readable tick labels
-                    ),
-                    yaxis=dict(
-                        autorange="reversed",
-                        showgrid=False,
-                        tickfont=dict(color='black', size=11),  # Dark, readable font
-                        title_font=dict(color='black', size=12),  # Dark, readable axis title
-                        # Reduce padding at top and bottom
-                        range=[-0.5, len(chart_df) - 0.5]  # Tight range around data points
-                    ),
-                    font=dict(size=11, color='black'),  # Dark, readable font
-                    paper_bgcolor='white',
-                    plot_bgcolor='white'
-                )
-                
-                # Display the chart
-                st.plotly_chart(
-                    fig, 
-                    use_container_width=True,
-                    config={
-                        'displayModeBar': True,
-                        'displaylogo': False,
-                        'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
-                        'scrollZoom': False,  # Enable scroll zoom for mobile
-                        'responsive': True   # Make chart responsive
-                    }
-                )
\ No newline at end of file
+        render_adp_chart(filtered_df)
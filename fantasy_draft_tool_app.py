@@ -8,6 +8,7 @@ Alternatively, you can configure Streamlit Cloud to use 'app/app.py' directly
 as the main file path in your app settings.
 """
 
+import runpy
 import sys
 from pathlib import Path
 
@@ -15,5 +16,6 @@ from pathlib import Path
 app_dir = Path(__file__).parent / "app"
 sys.path.insert(0, str(app_dir))
 
-# Execute the main app file
-exec(open(app_dir / "app.py").read())
+# Execute the main app file as a script of its own (its own globals and __file__),
+# without reading it into a string and exec-ing it in this module's namespace
+runpy.run_path(str(app_dir / "app.py"), run_name="__main__")
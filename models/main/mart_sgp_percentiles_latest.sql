@@ -0,0 +1,35 @@
+{{
+    config(
+        materialized='table'
+    )
+}}
+
+with filename_parts as (
+    select
+        category,
+        p80,
+        p90,
+        -- Extract format (after first space) and year (after second space)
+        split_part(_filename, ' ', 2) as format_part,
+        cast(split_part(_filename, ' ', 3) as int) as year_part
+    from {{ ref('mart_sgp_percentiles') }}
+),
+
+with_max_year as (
+    select
+        category,
+        p80,
+        p90,
+        format_part,
+        year_part,
+        max(year_part) over (partition by format_part) as max_year_part
+    from filename_parts
+)
+
+select
+    format_part,
+    category,
+    p80,
+    p90
+from with_max_year
+where year_part = max_year_part